@@ -9,33 +9,24 @@ import random
 import time
 import math
 import argparse
+import base64
+import copy
+import io
+import os
 import sys
-from datetime import datetime
+import types
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from datetime import datetime, time as dt_time
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Callable, FrozenSet, Mapping, Optional, Tuple
 
 import pyautogui
 from pynput import mouse, keyboard
-from pynput.keyboard import Key, KeyCode
+from pynput.keyboard import Key
 
-try:
-    import yaml
-except ImportError:
-    print("Error: PyYAML is required. Install it with: pip install pyyaml")
-    sys.exit(1)
-
-try:
-    from pystray import Icon, Menu, MenuItem
-    from PIL import Image, ImageDraw
-
-    TRAY_AVAILABLE = True
-except ImportError:
-    Icon = None  # type: ignore[assignment]
-    Menu = None  # type: ignore[assignment]
-    MenuItem = None  # type: ignore[assignment]
-    Image = None  # type: ignore[assignment]
-    ImageDraw = None  # type: ignore[assignment]
-    TRAY_AVAILABLE = False
+# pystray/PIL are imported on first use; cleared if the import fails
+TRAY_AVAILABLE = True
 
 
 # ============================================================================
@@ -47,16 +38,21 @@ class AppState:
     """Global application state"""
 
     def __init__(self):
-        self.last_activity_time = time.time()
+        self.last_activity_time = time.monotonic()
         self.cursor_movement_active = False
-        self.script_moving_cursor = False
         self.movement_count = 0
         self.total_distance: float = 0.0
-        self.session_start_time = time.time()
+        self.session_start_time = time.monotonic()
         self.paused = False
-        self.should_exit = False
+        # Pause states queued by toggle_pause for the movement loop to report
+        self.pause_notices: "deque[bool]" = deque()
+        self.exit_event = threading.Event()
         self.pattern_step = 0
-        self.last_position: Optional[Tuple[int, int]] = None
+        self.script_target: Optional[Tuple[int, int]] = None
+        self.mod_mask = 0  # Currently held hotkey modifiers, see MOD_BITS
+        self.hotkey_fired = False  # Set until a hotkey key is released
+        # Signalled when the movement loop should re-evaluate immediately
+        self.wake = threading.Event()
 
 
 state = AppState()
@@ -100,7 +96,7 @@ DEFAULT_CONFIG = {
     },
 }
 
-config = DEFAULT_CONFIG.copy()
+config = copy.deepcopy(DEFAULT_CONFIG)
 
 
 # ============================================================================
@@ -108,15 +104,57 @@ config = DEFAULT_CONFIG.copy()
 # ============================================================================
 
 
+# Parsed config files keyed by path, validated against (mtime, size)
+_yaml_cache: "OrderedDict[str, Tuple[float, int, dict]]" = OrderedDict()
+_YAML_CACHE_MAXSIZE = 16
+
+
+def _read_yaml(config_path):
+    """Parse a YAML file, reusing the cached result if the file is unchanged"""
+    st = os.stat(config_path)
+    cached = _yaml_cache.get(config_path)
+    if cached is not None and cached[:2] == (st.st_mtime, st.st_size):
+        _yaml_cache.move_to_end(config_path)
+        return copy.deepcopy(cached[2])
+
+    try:
+        import yaml
+    except ImportError:
+        print("Error: PyYAML is required. Install it with: pip install pyyaml")
+        sys.exit(1)
+
+    with open(config_path, "r") as f:
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        parsed = yaml.load(f, Loader=loader) or {}
+
+    _yaml_cache[config_path] = (st.st_mtime, st.st_size, parsed)
+    _yaml_cache.move_to_end(config_path)
+    if len(_yaml_cache) > _YAML_CACHE_MAXSIZE:
+        _yaml_cache.popitem(last=False)
+
+    # Hand out a copy so callers can't mutate the cached entry
+    return copy.deepcopy(parsed)
+
+
+def merge_config(base, override):
+    """Recursively merge override into base, keeping defaults for missing keys"""
+    for key, value in override.items():
+        if isinstance(value, dict) and isinstance(base.get(key), dict):
+            merge_config(base[key], value)
+        else:
+            base[key] = value
+
+
 def load_config(config_path="config.yaml"):
     """Load configuration from YAML file"""
     global config
 
     if Path(config_path).exists():
         try:
-            with open(config_path, "r") as f:
-                user_config = yaml.safe_load(f) or {}
-                config.update(user_config)
+            user_config = _read_yaml(config_path)
+            merged = copy.deepcopy(config)
+            merge_config(merged, user_config)
+            config = merged
             return True
         except Exception as e:
             print(f"Warning: Could not load config file: {e}")
@@ -125,6 +163,14 @@ def load_config(config_path="config.yaml"):
     return False
 
 
+def rand_upto(span, bits):
+    """Uniform integer in [0, span], where bits is span.bit_length()"""
+    value = random.getrandbits(bits)
+    while value > span:
+        value = random.getrandbits(bits)
+    return value
+
+
 def get_current_time():
     """Get formatted current time"""
     return datetime.now().strftime("%H:%M:%S - %B %d, %Y")
@@ -144,30 +190,50 @@ def format_duration(seconds):
         return f"{secs}s"
 
 
-def is_work_hours():
+# (minute since epoch, result) of the last work hours check
+_work_hours_cache = (-1, False)
+
+
+def is_work_hours(rt):
     """Check if current time is within work hours"""
-    if not config["work_hours_only"]:
+    global _work_hours_cache
+
+    if not rt.work_hours_only:
         return True
 
-    now = datetime.now()
+    # Work hours can only change on a minute boundary
+    minute = int(time.time() // 60)
+    if minute == _work_hours_cache[0]:
+        return _work_hours_cache[1]
 
-    # Check if today is a work day
-    if now.weekday() not in config["work_days"]:
-        return False
+    now = datetime.now()
+    result = (
+        now.weekday() in rt.work_days
+        and rt.work_start_time <= now.time() <= rt.work_end_time
+    )
+    _work_hours_cache = (minute, result)
+    return result
 
-    # Parse work hours
-    start_time = datetime.strptime(config["work_hours_start"], "%H:%M").time()
-    end_time = datetime.strptime(config["work_hours_end"], "%H:%M").time()
-    current_time = now.time()
 
-    return start_time <= current_time <= end_time
+# Call pyautogui's platform backend directly, skipping its per-call dispatch,
+# checks and PAUSE handling; the fail-safe is checked in the movement loop
+_backend = getattr(pyautogui, "platformModule", None)
+if _backend is not None:
+    _position = _backend._position
+    _move_to = _backend._moveTo
+    _size = _backend._size
+else:
+    _position = pyautogui.position
+    _move_to = pyautogui.moveTo
+    _size = pyautogui.size
 
 
-def get_screen_bounds():
+def get_screen_bounds(rt):
     """Get screen boundaries, considering multi-monitor setup"""
-    screen_width, screen_height = pyautogui.size()
+    # Queried live so resolution or monitor changes are picked up
+    screen_width, screen_height = _size()
 
-    if config["multi_monitor"] and config["preferred_monitor"] == -1:
+    if rt.multi_monitor and rt.preferred_monitor == -1:
         # Use all monitors - get total screen size
         # For simplicity, we use the primary screen bounds
         # In a real multi-monitor setup, you'd query all screens
@@ -176,9 +242,9 @@ def get_screen_bounds():
         return 0, 0, screen_width, screen_height
 
 
-def constrain_to_screen(x, y):
+def constrain_to_screen(rt, x, y):
     """Constrain coordinates to screen boundaries"""
-    min_x, min_y, max_x, max_y = get_screen_bounds()
+    min_x, min_y, max_x, max_y = get_screen_bounds(rt)
 
     x = max(min_x, min(x, max_x - 1))
     y = max(min_y, min(y, max_y - 1))
@@ -186,24 +252,42 @@ def constrain_to_screen(x, y):
     return int(x), int(y)
 
 
-def log(message, level="normal"):
-    """Print message based on verbosity level"""
-    verbosity = config["verbosity"]
+def log(message, level="normal", rt=None):
+    """Print message based on verbosity level of rt (default: current config)"""
+    if rt is None:
+        rt = runtime
 
-    if verbosity == "quiet" and level != "important":
+    if level == "normal" and not rt.log_normal:
         return
 
-    if verbosity == "normal" and level == "verbose":
+    if level == "verbose" and not rt.log_verbose:
         return
 
     print(message)
 
 
-def emoji(char, fallback=""):
-    """Return emoji if enabled, otherwise return fallback"""
-    if config["use_emoji"]:
-        return char
-    return fallback
+# Message prefixes as (emoji, plain-text fallback)
+EMOJI_CHOICES = {
+    "header": ("🖱️  ", ""),
+    "stats": ("📊", ""),
+    "paused": ("⏸️ ", "[PAUSED]"),
+    "resumed": ("▶️ ", "[RESUMED]"),
+    "time": ("⏰", "[TIME]"),
+    "stop": ("✋", "[STOP]"),
+    "idle": ("⏱️ ", "[IDLE]"),
+    "start": ("🚀", "[START]"),
+    "warning": ("⚠️ ", "[WARNING]"),
+    "move": ("🖱️ ", "[MOVE]"),
+    "ok": ("✅", "[OK]"),
+    "shutdown": ("🛑", "[STOP]"),
+    "bye": ("👋", ""),
+}
+
+
+def build_emoji(use_emoji):
+    """Resolve every message prefix to its emoji or fallback"""
+    index = 0 if use_emoji else 1
+    return {name: choice[index] for name, choice in EMOJI_CHOICES.items()}
 
 
 # ============================================================================
@@ -215,19 +299,25 @@ class MovementPattern:
     """Base class for movement patterns"""
 
     @staticmethod
-    def get_next_position(current_x, current_y):
+    def get_next_position(rt, current_x, current_y):
         """Get next position based on pattern. Return (dx, dy)"""
         raise NotImplementedError
 
 
+def _replay(offsets):
+    """Return the next (dx, dy) from a precomputed periodic pattern table"""
+    step = state.pattern_step % len(offsets)
+    state.pattern_step = step + 1
+    return offsets[step]
+
+
 class RandomPattern(MovementPattern):
     """Random movement pattern"""
 
     @staticmethod
-    def get_next_position(current_x, current_y):
-        movement_range = config["movement_range"]
-        dx = random.randint(-movement_range, movement_range)
-        dy = random.randint(-movement_range, movement_range)
+    def get_next_position(rt, current_x, current_y):
+        dx = rand_upto(rt.random_span, rt.random_bits) - rt.movement_range
+        dy = rand_upto(rt.random_span, rt.random_bits) - rt.movement_range
         return dx, dy
 
 
@@ -235,112 +325,286 @@ class CirclePattern(MovementPattern):
     """Circular movement pattern"""
 
     @staticmethod
-    def get_next_position(current_x, current_y):
-        settings = config["pattern_settings"]["circle"]
-        radius = settings["radius"]
-        steps = settings["steps"]
-
-        angle = (state.pattern_step * 2 * math.pi) / steps
-        state.pattern_step = (state.pattern_step + 1) % steps
-
-        if state.last_position is None:
-            state.last_position = (current_x, current_y)
-            center_x, center_y = current_x, current_y
-        else:
-            center_x, center_y = state.last_position
-
-        dx = int(radius * math.cos(angle))
-        dy = int(radius * math.sin(angle))
-
-        return dx, dy
+    def get_next_position(rt, current_x, current_y):
+        return _replay(rt.circle_offsets)
 
 
 class Figure8Pattern(MovementPattern):
     """Figure-8 movement pattern"""
 
     @staticmethod
-    def get_next_position(current_x, current_y):
-        settings = config["pattern_settings"]["figure8"]
-        width = settings["width"]
-        height = settings["height"]
-        steps = settings["steps"]
-
-        t = (state.pattern_step * 2 * math.pi) / steps
-        state.pattern_step = (state.pattern_step + 1) % steps
-
-        # Lissajous curve for figure-8
-        dx = int(width * math.sin(t))
-        dy = int(height * math.sin(2 * t) / 2)
-
-        return dx, dy
+    def get_next_position(rt, current_x, current_y):
+        return _replay(rt.figure8_offsets)
 
 
 class SmoothPattern(MovementPattern):
     """Smooth wave movement pattern"""
 
     @staticmethod
-    def get_next_position(current_x, current_y):
-        settings = config["pattern_settings"]["smooth"]
-        amplitude = settings["amplitude"]
-        frequency = settings["frequency"]
-
-        t = state.pattern_step * frequency
-        state.pattern_step += 1
-
-        dx = int(amplitude * math.sin(t))
-        dy = int(amplitude * math.cos(t * 0.7))  # Different frequency for y
-
-        return dx, dy
+    def get_next_position(rt, current_x, current_y):
+        return _replay(rt.smooth_offsets)
 
 
 class JigglePattern(MovementPattern):
     """Small jiggle movement in place"""
 
     @staticmethod
-    def get_next_position(current_x, current_y):
-        max_dist = config["pattern_settings"]["jiggle"]["max_distance"]
+    def get_next_position(rt, current_x, current_y):
+        dx = rand_upto(rt.jiggle_span, rt.jiggle_bits) - rt.jiggle_max_distance
+        dy = rand_upto(rt.jiggle_span, rt.jiggle_bits) - rt.jiggle_max_distance
+        return dx, dy
 
-        dx = random.randint(-max_dist, max_dist)
-        dy = random.randint(-max_dist, max_dist)
 
-        return dx, dy
+# Unit vectors for 256 evenly spaced angles, indexed by an 8-bit random number
+HUMAN_DIRECTIONS = tuple(
+    (math.cos(2 * math.pi * i / 256), math.sin(2 * math.pi * i / 256))
+    for i in range(256)
+)
 
 
 class HumanPattern(MovementPattern):
     """Human-like movement with varying distances"""
 
     @staticmethod
-    def get_next_position(current_x, current_y):
-        settings = config["pattern_settings"]["human"]
-        min_dist = settings["min_distance"]
-        max_dist = settings["max_distance"]
-
+    def get_next_position(rt, current_x, current_y):
         # Random distance
-        distance = random.randint(min_dist, max_dist)
+        distance = rt.human_min_distance + rand_upto(rt.human_span, rt.human_bits)
 
         # Random angle
-        angle = random.uniform(0, 2 * math.pi)
+        cos_a, sin_a = HUMAN_DIRECTIONS[random.getrandbits(8)]
 
-        dx = int(distance * math.cos(angle))
-        dy = int(distance * math.sin(angle))
+        dx = int(distance * cos_a)
+        dy = int(distance * sin_a)
 
         return dx, dy
 
 
 PATTERNS = {
-    "random": RandomPattern,
-    "circle": CirclePattern,
-    "figure8": Figure8Pattern,
-    "smooth": SmoothPattern,
-    "jiggle": JigglePattern,
-    "human": HumanPattern,
+    "random": RandomPattern.get_next_position,
+    "circle": CirclePattern.get_next_position,
+    "figure8": Figure8Pattern.get_next_position,
+    "smooth": SmoothPattern.get_next_position,
+    "jiggle": JigglePattern.get_next_position,
+    "human": HumanPattern.get_next_position,
 }
 
 
-def get_movement_pattern():
-    """Get the current movement pattern class"""
-    pattern_name = config["movement_pattern"]
-    return PATTERNS.get(pattern_name, RandomPattern)
+# ============================================================================
+# RUNTIME CONFIGURATION
+# ============================================================================
+
+
+SMOOTH_TABLE_SIZE = 1024
+
+
+def parse_clock_time(value):
+    """Parse an 'HH:MM' work hours setting"""
+    try:
+        return datetime.strptime(str(value), "%H:%M").time()
+    except ValueError:
+        raise ValueError(f"expected HH:MM time, got {value!r}") from None
+
+
+def build_circle_offsets(radius, steps):
+    """Precompute one lap of the circle pattern"""
+    offsets = []
+    for i in range(steps):
+        angle = 2 * math.pi * i / steps
+        dx = int(radius * math.cos(angle))
+        dy = int(radius * math.sin(angle))
+        offsets.append((dx, dy))
+    return tuple(offsets)
+
+
+def build_figure8_offsets(width, height, steps):
+    """Precompute one lap of the figure-8 (Lissajous) pattern"""
+    offsets = []
+    for i in range(steps):
+        t = 2 * math.pi * i / steps
+        dx = int(width * math.sin(t))
+        dy = int(height * math.sin(2 * t) / 2)
+        offsets.append((dx, dy))
+    return tuple(offsets)
+
+
+def build_smooth_offsets(amplitude, frequency):
+    """Precompute the smooth wave pattern as a fixed-size ring"""
+    offsets = []
+    for i in range(SMOOTH_TABLE_SIZE):
+        t = i * frequency
+        dx = int(amplitude * math.sin(t))
+        dy = int(amplitude * math.cos(t * 0.7))  # Different frequency for y
+        offsets.append((dx, dy))
+    return tuple(offsets)
+
+
+@dataclass(frozen=True, slots=True)
+class RuntimeConfig:
+    """Immutable snapshot of config values resolved for the running program"""
+
+    idle_timeout: float
+    movement_interval: float
+    status_update_interval: float
+    movement_pattern: str
+    next_pos: Callable[["RuntimeConfig", int, int], Tuple[int, int]]
+    emoji: Mapping[str, str]
+    pause_hotkey: str
+
+    # Verbosity, so callers can skip building messages that log() would drop
+    log_normal: bool
+    log_verbose: bool
+
+    # Work hours, parsed once instead of on every check; None when disabled
+    work_hours_only: bool
+    work_start_time: Optional[dt_time]
+    work_end_time: Optional[dt_time]
+    work_days: FrozenSet[int]
+
+    # Screen selection for constraining moves
+    multi_monitor: bool
+    preferred_monitor: int
+
+    # Adaptive intervals flattened into plain floats
+    adaptive_intervals: bool
+    short_idle_threshold: float
+    short_idle_interval: float
+    medium_idle_threshold: float
+    medium_idle_interval: float
+    long_idle_interval: float
+
+    # Random patterns draw from getrandbits with precomputed bit widths
+    movement_range: int
+    random_span: int
+    random_bits: int
+    jiggle_max_distance: int
+    jiggle_span: int
+    jiggle_bits: int
+    human_min_distance: int
+    human_span: int
+    human_bits: int
+
+    # Periodic patterns replay precomputed (dx, dy) tables; empty unless active
+    circle_offsets: Tuple[Tuple[int, int], ...]
+    figure8_offsets: Tuple[Tuple[int, int], ...]
+    smooth_offsets: Tuple[Tuple[int, int], ...]
+
+    @classmethod
+    def from_config(cls, cfg):
+        """Build a snapshot from a merged config dict
+
+        Raises KeyError, TypeError or ValueError for missing or malformed
+        settings. Settings for disabled features are not read.
+        """
+        patterns = cfg["pattern_settings"]
+        pattern = cfg["movement_pattern"]
+
+        random_span = max(2 * cfg["movement_range"], 0)
+
+        # Work hours are only parsed when the feature is on
+        work_hours_only = cfg["work_hours_only"]
+        work_start_time = work_end_time = None
+        work_days: FrozenSet[int] = frozenset()
+        if work_hours_only:
+            work_start_time = parse_clock_time(cfg["work_hours_start"])
+            work_end_time = parse_clock_time(cfg["work_hours_end"])
+            work_days = frozenset(cfg["work_days"])
+
+        # Adaptive thresholds are only flattened when the feature is on
+        adaptive_intervals = cfg["adaptive_intervals"]
+        short_idle_threshold = short_idle_interval = 0.0
+        medium_idle_threshold = medium_idle_interval = long_idle_interval = 0.0
+        if adaptive_intervals:
+            adaptive = cfg["adaptive_settings"]
+            short_idle_threshold = float(adaptive["short_idle"]["threshold"])
+            short_idle_interval = float(adaptive["short_idle"]["interval"])
+            medium_idle_threshold = float(adaptive["medium_idle"]["threshold"])
+            medium_idle_interval = float(adaptive["medium_idle"]["interval"])
+            long_idle_interval = float(adaptive["long_idle"]["interval"])
+
+        # Only the active random pattern's settings are read
+        jiggle_max_distance = jiggle_span = 0
+        human_min_distance = human_span = 0
+        if pattern == "jiggle":
+            jiggle_max_distance = patterns["jiggle"]["max_distance"]
+            jiggle_span = max(2 * jiggle_max_distance, 0)
+        elif pattern == "human":
+            human = patterns["human"]
+            human_min_distance = human["min_distance"]
+            human_span = max(human["max_distance"] - human_min_distance, 0)
+
+        # Only the active periodic pattern needs its offset table
+        circle_offsets = figure8_offsets = smooth_offsets = ()
+        if pattern == "circle":
+            circle = patterns["circle"]
+            circle_offsets = build_circle_offsets(circle["radius"], circle["steps"])
+        elif pattern == "figure8":
+            figure8 = patterns["figure8"]
+            figure8_offsets = build_figure8_offsets(
+                figure8["width"], figure8["height"], figure8["steps"]
+            )
+        elif pattern == "smooth":
+            smooth = patterns["smooth"]
+            smooth_offsets = build_smooth_offsets(
+                smooth["amplitude"], smooth["frequency"]
+            )
+
+        return cls(
+            idle_timeout=cfg["idle_timeout"],
+            movement_interval=cfg["movement_interval"],
+            status_update_interval=cfg["status_update_interval"],
+            movement_pattern=pattern,
+            next_pos=PATTERNS.get(pattern, RandomPattern.get_next_position),
+            emoji=types.MappingProxyType(build_emoji(cfg["use_emoji"])),
+            pause_hotkey=cfg["pause_hotkey"],
+            log_normal=cfg["verbosity"] != "quiet",
+            log_verbose=cfg["verbosity"] not in ("quiet", "normal"),
+            work_hours_only=work_hours_only,
+            work_start_time=work_start_time,
+            work_end_time=work_end_time,
+            work_days=work_days,
+            multi_monitor=cfg["multi_monitor"],
+            preferred_monitor=cfg["preferred_monitor"],
+            adaptive_intervals=adaptive_intervals,
+            short_idle_threshold=short_idle_threshold,
+            short_idle_interval=short_idle_interval,
+            medium_idle_threshold=medium_idle_threshold,
+            medium_idle_interval=medium_idle_interval,
+            long_idle_interval=long_idle_interval,
+            movement_range=cfg["movement_range"],
+            random_span=random_span,
+            random_bits=random_span.bit_length(),
+            jiggle_max_distance=jiggle_max_distance,
+            jiggle_span=jiggle_span,
+            jiggle_bits=jiggle_span.bit_length(),
+            human_min_distance=human_min_distance,
+            human_span=human_span,
+            human_bits=human_span.bit_length(),
+            circle_offsets=circle_offsets,
+            figure8_offsets=figure8_offsets,
+            smooth_offsets=smooth_offsets,
+        )
+
+
+runtime = RuntimeConfig.from_config(config)
+
+
+def rebuild_runtime_config():
+    """Recompute the runtime snapshot after config changes
+
+    Readers pick up the new snapshot through a single reference swap, so
+    they never see a mix of old and new values.
+    """
+    global config, runtime, _work_hours_cache
+
+    try:
+        runtime = RuntimeConfig.from_config(config)
+    except (KeyError, TypeError, ValueError) as e:
+        detail = f"missing setting {e}" if isinstance(e, KeyError) else e
+        print(f"Warning: Invalid configuration: {detail}")
+        print("Using default configuration.")
+        config = copy.deepcopy(DEFAULT_CONFIG)
+        runtime = RuntimeConfig.from_config(config)
+    _work_hours_cache = (-1, False)
 
 
 # ============================================================================
@@ -351,7 +615,10 @@ def get_movement_pattern():
 def print_header():
     """Print startup header with configuration"""
     log("=" * 70, "important")
-    log(f"  {emoji('🖱️  ', '')}PENGGERAK TIKUS - Automatic Cursor Mover", "important")
+    log(
+        f"  {runtime.emoji['header']}PENGGERAK TIKUS - Automatic Cursor Mover",
+        "important",
+    )
     log("=" * 70, "important")
     log(f"Started at: {get_current_time()}", "important")
     log("\nConfiguration:", "important")
@@ -387,9 +654,9 @@ def print_header():
 
 def print_statistics():
     """Print current statistics"""
-    session_duration = time.time() - state.session_start_time
+    session_duration = time.monotonic() - state.session_start_time
     log(f"\n{'─' * 70}", "important")
-    log(f"{emoji('📊', '')} Session Statistics:", "important")
+    log(f"{runtime.emoji['stats']} Session Statistics:", "important")
     log(f"  - Session duration: {format_duration(session_duration)}", "important")
     log(f"  - Total cursor movements: {state.movement_count}", "important")
     log(f"  - Total distance traveled: {int(state.total_distance)} pixels", "important")
@@ -407,23 +674,17 @@ def print_statistics():
 
 
 def update_last_activity():
-    """Update last activity time"""
-    if not state.script_moving_cursor and not state.paused:
-        state.last_activity_time = time.time()
-        if state.cursor_movement_active:
-            log(f"\n{emoji('✋', '[STOP]')} {get_current_time()}", "normal")
-            log(
-                "   User activity detected! Stopping automatic cursor movement.",
-                "normal",
-            )
-            log(f"   Total movements in this session: {state.movement_count}", "normal")
-            state.cursor_movement_active = False
-            state.pattern_step = 0  # Reset pattern
-            state.last_position = None
+    """Update last activity time; the movement loop reacts to the change"""
+    state.last_activity_time = time.monotonic()
+    if state.cursor_movement_active:
+        state.wake.set()
 
 
 def on_move(x, y):
     """Mouse move handler"""
+    # Ignore the event generated by our own move
+    if state.script_target == (int(x), int(y)):
+        return
     update_last_activity()
 
 
@@ -449,92 +710,128 @@ def on_release(key):
     on_hotkey_release(key)
 
 
+# Modifier keys packed into bits; left/right variants share a bit
+MOD_BITS = {
+    Key.ctrl: 1,
+    Key.ctrl_l: 1,
+    Key.ctrl_r: 1,
+    Key.shift: 2,
+    Key.shift_l: 2,
+    Key.shift_r: 2,
+    Key.alt: 4,
+    Key.alt_l: 4,
+    Key.alt_r: 4,
+    Key.alt_gr: 4,
+    Key.cmd: 8,
+    Key.cmd_l: 8,
+    Key.cmd_r: 8,
+}
+MODIFIER_NAMES = {"ctrl": 1, "shift": 2, "alt": 4, "cmd": 8}
+
 # Hotkey state tracking
-hotkey_pressed = set()
-expected_hotkey = set()
+hotkey_enabled = False
+expected_mod_mask = 0
+expected_char: Optional[str] = None
 
 
 def refresh_hotkey_binding():
     """Cache the parsed hotkey combination for faster comparison"""
-    global expected_hotkey
+    global hotkey_enabled, expected_mod_mask, expected_char
 
-    hotkey_pressed.clear()
-    if not config.get("enable_pause_hotkey"):
-        expected_hotkey = set()
+    state.mod_mask = 0
+    state.hotkey_fired = False
+    hotkey_enabled = bool(config.get("enable_pause_hotkey"))
+    if not hotkey_enabled:
+        expected_mod_mask, expected_char = 0, None
         return
 
-    expected_hotkey = parse_hotkey(config["pause_hotkey"])
+    expected_mod_mask, expected_char = parse_hotkey(config["pause_hotkey"])
 
 
 def parse_hotkey(hotkey_string):
-    """Parse hotkey string like 'ctrl+shift+p' into key components"""
-    parts = hotkey_string.lower().split("+")
-    keys = []
-
-    for part in parts:
-        if part == "ctrl":
-            keys.append(Key.ctrl)
-        elif part == "shift":
-            keys.append(Key.shift)
-        elif part == "alt":
-            keys.append(Key.alt)
-        elif part == "cmd":
-            keys.append(Key.cmd)
+    """Parse hotkey string like 'ctrl+shift+p' into (modifier mask, char)"""
+    mod_mask = 0
+    char = None
+
+    for part in hotkey_string.lower().split("+"):
+        if part in MODIFIER_NAMES:
+            mod_mask |= MODIFIER_NAMES[part]
         else:
             # Regular character key
-            keys.append(KeyCode.from_char(part))
+            char = part
 
-    return set(keys)
+    return mod_mask, char
 
 
 def on_hotkey_press(key):
     """Handle hotkey press for pause/resume"""
-    global hotkey_pressed
+    if not hotkey_enabled:
+        return
 
-    if config["enable_pause_hotkey"] and expected_hotkey:
-        try:
-            hotkey_pressed.add(key)
-
-            # Normalize the pressed keys
-            normalized_pressed = set()
-            for k in hotkey_pressed:
-                if hasattr(k, "char"):
-                    if k.char:
-                        normalized_pressed.add(KeyCode.from_char(k.char.lower()))
-                else:
-                    normalized_pressed.add(k)
-
-            # Check if hotkey matches
-            if normalized_pressed >= expected_hotkey:
-                toggle_pause()
-                hotkey_pressed.clear()
-        except AttributeError:
-            pass
+    bit = MOD_BITS.get(key)
+    if bit is not None:
+        state.mod_mask |= bit
+        # Modifier-only hotkeys fire once the last modifier goes down
+        if (
+            expected_char is None
+            and not state.hotkey_fired
+            and state.mod_mask == expected_mod_mask
+        ):
+            state.hotkey_fired = True
+            toggle_pause()
+        return
+
+    # Auto-repeat of a held combination must not toggle again
+    if state.hotkey_fired:
+        return
+
+    char = getattr(key, "char", None)
+    if char and state.mod_mask == expected_mod_mask and char.lower() == expected_char:
+        state.hotkey_fired = True
+        toggle_pause()
 
 
 def on_hotkey_release(key):
     """Handle hotkey release"""
-    global hotkey_pressed
-    try:
-        hotkey_pressed.discard(key)
-    except KeyError:
-        pass
+    bit = MOD_BITS.get(key)
+    if bit is not None:
+        state.mod_mask &= ~bit
+        state.hotkey_fired = False
+        return
+
+    char = getattr(key, "char", None)
+    if char and char.lower() == expected_char:
+        state.hotkey_fired = False
 
 
 def toggle_pause():
-    """Toggle pause state"""
+    """Toggle pause state; the movement loop reports the change"""
     state.paused = not state.paused
+    state.pause_notices.append(state.paused)
 
     if state.paused:
-        log(f"\n{emoji('⏸️ ', '[PAUSED]')} {get_current_time()}", "important")
-        log(
-            f"   Program paused. Press {config['pause_hotkey']} to resume.", "important"
-        )
         state.cursor_movement_active = False
+        state.script_target = None
+    else:
+        state.last_activity_time = time.monotonic()  # Reset idle timer
+
+    state.wake.set()
+
+
+def log_pause_change(rt, paused):
+    """Print the pause/resume notice"""
+    if paused:
+        log(f"\n{rt.emoji['paused']} {get_current_time()}", "important", rt)
+        log(f"   Program paused. Press {rt.pause_hotkey} to resume.", "important", rt)
     else:
-        log(f"\n{emoji('▶️ ', '[RESUMED]')} {get_current_time()}", "important")
-        log("   Program resumed. Monitoring activity...", "important")
-        state.last_activity_time = time.time()  # Reset idle timer
+        log(f"\n{rt.emoji['resumed']} {get_current_time()}", "important", rt)
+        log("   Program resumed. Monitoring activity...", "important", rt)
+
+
+def request_exit():
+    """Signal every thread waiting on state to shut down"""
+    state.exit_event.set()
+    state.wake.set()
 
 
 # ============================================================================
@@ -542,134 +839,171 @@ def toggle_pause():
 # ============================================================================
 
 
-def get_adaptive_interval():
-    """Get movement interval based on idle time"""
-    if not config["adaptive_intervals"]:
-        return config["movement_interval"]
+def is_failsafe_position(x, y):
+    """Check if the cursor sits on one of pyautogui's fail-safe corners"""
+    return pyautogui.FAILSAFE and (x, y) in pyautogui.FAILSAFE_POINTS
 
-    time_since_last_activity = time.time() - state.last_activity_time
-    adaptive = config["adaptive_settings"]
 
-    if time_since_last_activity < adaptive["short_idle"]["threshold"]:
-        return adaptive["short_idle"]["interval"]
-    elif time_since_last_activity < adaptive["medium_idle"]["threshold"]:
-        return adaptive["medium_idle"]["interval"]
+def get_adaptive_interval(rt, time_since_last_activity):
+    """Get movement interval based on idle time"""
+    if not rt.adaptive_intervals:
+        return rt.movement_interval
+
+    if time_since_last_activity < rt.short_idle_threshold:
+        return rt.short_idle_interval
+    elif time_since_last_activity < rt.medium_idle_threshold:
+        return rt.medium_idle_interval
     else:
-        return adaptive["long_idle"]["interval"]
+        return rt.long_idle_interval
 
 
 def move_cursor_randomly():
     """Main cursor movement loop"""
-    last_status_update = time.time()
+    last_status_update = time.monotonic()
+
+    while not state.exit_event.is_set():
+        # Clear before reading state so a signal during this pass isn't lost
+        state.wake.clear()
+        now = time.monotonic()
 
-    while not state.should_exit:
-        # Skip if paused
+        # One consistent config snapshot per pass
+        rt = runtime
+        idle_timeout = rt.idle_timeout
+        status_update_interval = rt.status_update_interval
+
+        # Report every pause change here so input callbacks never print
+        while state.pause_notices:
+            log_pause_change(rt, state.pause_notices.popleft())
+
+        # Skip if paused; toggle_pause wakes us up again
         if state.paused:
-            time.sleep(0.5)
+            state.wake.wait()
             continue
 
         # Skip if outside work hours
-        if not is_work_hours():
+        if rt.work_hours_only and not is_work_hours(rt):
             if not state.cursor_movement_active:
-                current_time = time.time()
-                if (current_time - last_status_update) >= config[
-                    "status_update_interval"
-                ]:
-                    log(
-                        f"{emoji('⏰', '[TIME]')} Outside work hours. Sleeping...",
-                        "verbose",
-                    )
-                    last_status_update = current_time
-            time.sleep(60)  # Check every minute
+                if (now - last_status_update) >= status_update_interval:
+                    if rt.log_verbose:
+                        log(
+                            f"{rt.emoji['time']} Outside work hours. Sleeping...",
+                            "verbose",
+                            rt,
+                        )
+                    last_status_update = now
+            state.wake.wait(60)  # Check every minute
             continue
 
-        current_time = time.time()
-        time_since_last_activity = current_time - state.last_activity_time
+        time_since_last_activity = now - state.last_activity_time
+
+        # Stop cursor movement once the user is active again
+        if state.cursor_movement_active and time_since_last_activity < idle_timeout:
+            if rt.log_normal:
+                log(f"\n{rt.emoji['stop']} {get_current_time()}", "normal", rt)
+                log(
+                    "   User activity detected! Stopping automatic cursor movement.",
+                    "normal",
+                    rt,
+                )
+                log(
+                    f"   Total movements in this session: {state.movement_count}",
+                    "normal",
+                    rt,
+                )
+            state.cursor_movement_active = False
+            state.script_target = None
+            state.pattern_step = 0  # Reset pattern
 
         # Show periodic status updates when user is active
         if (
             not state.cursor_movement_active
-            and (current_time - last_status_update) >= config["status_update_interval"]
+            and (now - last_status_update) >= status_update_interval
         ):
-            idle_percentage = (time_since_last_activity / config["idle_timeout"]) * 100
-            remaining = config["idle_timeout"] - time_since_last_activity
+            idle_percentage = (time_since_last_activity / idle_timeout) * 100
+            remaining = idle_timeout - time_since_last_activity
 
-            if idle_percentage < 100:
+            if rt.log_normal and idle_percentage < 100:
                 log(
-                    f"{emoji('⏱️ ', '[IDLE]')} Idle: {format_duration(time_since_last_activity)} / {format_duration(config['idle_timeout'])} "
+                    f"{rt.emoji['idle']} Idle: {format_duration(time_since_last_activity)} / {format_duration(idle_timeout)} "
                     f"({min(idle_percentage, 100):.0f}%) - {format_duration(remaining)} until auto-movement",
                     "normal",
+                    rt,
                 )
 
-            last_status_update = current_time
+            last_status_update = now
 
         # Start cursor movement when idle threshold is reached
         if (
             not state.cursor_movement_active
-            and time_since_last_activity >= config["idle_timeout"]
+            and time_since_last_activity >= idle_timeout
         ):
             state.cursor_movement_active = True
-            log(f"\n{emoji('🚀', '[START]')} {get_current_time()}", "normal")
-            log(
-                f"   Idle timeout reached ({format_duration(config['idle_timeout'])})!",
-                "normal",
-            )
-            log(
-                f"   Starting automatic cursor movement with pattern: {config['movement_pattern']}\n",
-                "normal",
-            )
+            if rt.log_normal:
+                log(f"\n{rt.emoji['start']} {get_current_time()}", "normal", rt)
+                log(
+                    f"   Idle timeout reached ({format_duration(idle_timeout)})!",
+                    "normal",
+                    rt,
+                )
+                log(
+                    f"   Starting automatic cursor movement with pattern: {rt.movement_pattern}\n",
+                    "normal",
+                    rt,
+                )
 
         # Move cursor if active
         if state.cursor_movement_active:
-            state.script_moving_cursor = True
-            x, y = pyautogui.position()
+            x, y = _position()
+
+            if is_failsafe_position(x, y):
+                log(
+                    f"\n{rt.emoji['warning']} Failsafe triggered! Cursor in corner.",
+                    "important",
+                    rt,
+                )
+                state.cursor_movement_active = False
+                state.script_target = None
+                # Restart the idle countdown instead of retrying immediately
+                state.last_activity_time = now
+                continue
 
             # Get movement from pattern
-            pattern_class = get_movement_pattern()
-            dx, dy = pattern_class.get_next_position(x, y)
+            dx, dy = rt.next_pos(rt, x, y)
 
-            new_x, new_y = constrain_to_screen(x + dx, y + dy)
+            new_x, new_y = constrain_to_screen(rt, x + dx, y + dy)
 
             # Calculate actual distance
             actual_dx = new_x - x
             actual_dy = new_y - y
-            distance = math.sqrt(actual_dx**2 + actual_dy**2)
-
-            # Move cursor with adaptive interval
-            interval = (
-                get_adaptive_interval()
-                if config["adaptive_intervals"]
-                else config["movement_interval"]
-            )
+            distance = math.hypot(actual_dx, actual_dy)
 
-            try:
-                pyautogui.moveTo(new_x, new_y, duration=interval)
-            except pyautogui.FailSafeException:
-                log(
-                    f"\n{emoji('⚠️ ', '[WARNING]')} Failsafe triggered! Cursor in corner.",
-                    "important",
-                )
-                state.cursor_movement_active = False
-                state.script_moving_cursor = False
-                continue
+            # Jump straight to the target; the adaptive interval is spent sleeping
+            interval = get_adaptive_interval(rt, time_since_last_activity)
+            state.script_target = (new_x, new_y)
+            _move_to(new_x, new_y)
 
             # Update statistics
             state.movement_count += 1
             state.total_distance += distance
 
             # Print movement info
-            log(
-                f"{emoji('🖱️ ', '[MOVE]')} Move #{state.movement_count}: ({x}, {y}) → ({new_x}, {new_y}) | "
-                f"Distance: {int(distance)}px | Total: {int(state.total_distance)}px",
-                "normal",
-            )
-
-            state.script_moving_cursor = False
+            if rt.log_normal:
+                log(
+                    f"{rt.emoji['move']} Move #{state.movement_count}: ({x}, {y}) → ({new_x}, {new_y}) | "
+                    f"Distance: {int(distance)}px | Total: {int(state.total_distance)}px",
+                    "normal",
+                    rt,
+                )
 
-            # Use adaptive interval for sleep
-            time.sleep(interval)
+            # Use adaptive interval for sleep, cut short by user activity
+            state.wake.wait(interval)
         else:
-            time.sleep(0.1)
+            # Sleep until the idle timeout or the next status update is due
+            next_deadline = min(
+                state.last_activity_time + idle_timeout,
+                last_status_update + status_update_interval,
+            )
+            state.wake.wait(max(next_deadline - time.monotonic(), 0))
 
 
 # ============================================================================
@@ -677,32 +1011,34 @@ def move_cursor_randomly():
 # ============================================================================
 
 
+# 64x64 tray icon (blue square with a white cursor arrow), pre-rendered as PNG
+ICON_PNG_B64 = (
+    b"iVBORw0KGgoAAAANSUhEUgAAAEAAAABACAIAAAAlC+aJAAAAcUlEQVR42u3ZQQrAIAwEwPz/"
+    b"0woFoSIWLSgEZtnrHuYWSJTkCQAAAAAAAAAAAACAa4A4nwuAcrIAAF2fCQDAT8BrBQCwDRiG"
+    b"AAAbgMkWAGAJ8Dl3jQIAAAAAAAAAAADkBmT+D3gxAQAAAAAAAAAAALRUUzBK2oStMCkAAAAA"
+    b"SUVORK5CYII="
+)
+
+
 def create_tray_icon():
     """Create system tray icon"""
-    if (
-        not TRAY_AVAILABLE
-        or not config["enable_system_tray"]
-        or Icon is None
-        or Menu is None
-        or MenuItem is None
-        or Image is None
-        or ImageDraw is None
-    ):
+    global TRAY_AVAILABLE
+
+    if not TRAY_AVAILABLE or not config["enable_system_tray"]:
         return None
 
-    # Create a simple icon
-    width = 64
-    height = 64
-    image = Image.new("RGB", (width, height), "white")
-    dc = ImageDraw.Draw(image)
+    try:
+        from pystray import Icon, Menu, MenuItem
+        from PIL import Image
+    except ImportError:
+        TRAY_AVAILABLE = False
+        return None
 
-    # Draw a simple mouse cursor icon
-    dc.rectangle([16, 16, 48, 48], fill="blue", outline="black")
-    dc.polygon([(32, 20), (28, 32), (36, 32)], fill="white")
+    image = Image.open(io.BytesIO(base64.b64decode(ICON_PNG_B64)))
 
     def on_quit(icon, item):
         """Quit from tray"""
-        state.should_exit = True
+        request_exit()
         icon.stop()
 
     def on_pause_resume(icon, item):
@@ -806,8 +1142,13 @@ def main():
     if args.no_emoji:
         config["use_emoji"] = False
 
+    rebuild_runtime_config()
     refresh_hotkey_binding()
 
+    # Moves are instantaneous; drop pyautogui's implicit per-call delays
+    pyautogui.PAUSE = 0
+    pyautogui.MINIMUM_DURATION = 0
+
     # Print startup header
     print_header()
 
@@ -837,25 +1178,34 @@ def main():
             else:
                 tray_thread = threading.Thread(target=tray_icon.run, daemon=True)
                 tray_thread.start()
-            log(f"{emoji('✅', '[OK]')} System tray icon enabled", "normal")
+            log(f"{runtime.emoji['ok']} System tray icon enabled", "normal")
+
+    log(
+        f"{runtime.emoji['ok']} All systems active. Monitoring started!\n",
+        "important",
+    )
 
-    log(f"{emoji('✅', '[OK]')} All systems active. Monitoring started!\n", "important")
+    # Event.wait() without a timeout can't be interrupted by Ctrl+C on Windows
+    wait_timeout = 1 if sys.platform == "win32" else None
 
     try:
-        # Keep the program running
-        while not state.should_exit:
-            time.sleep(1)
+        # Keep the program running until Ctrl+C or tray Quit
+        while not state.exit_event.wait(wait_timeout):
+            pass
     except KeyboardInterrupt:
         log(
-            f"\n\n{emoji('🛑', '[STOP]')} Shutdown initiated by user (Ctrl+C)\n",
+            f"\n\n{runtime.emoji['shutdown']} Shutdown initiated by user (Ctrl+C)\n",
             "important",
         )
         print_statistics()
         log(f"Final session ended at: {get_current_time()}", "important")
-        log(f"\nThank you for using Penggerak Tikus! {emoji('👋', '')}", "important")
+        log(
+            f"\nThank you for using Penggerak Tikus! {runtime.emoji['bye']}",
+            "important",
+        )
     finally:
         # Cleanup
-        state.should_exit = True
+        request_exit()
         mouse_listener.stop()
         keyboard_listener.stop()
         if tray_icon: